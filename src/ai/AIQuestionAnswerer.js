@@ -1,6 +1,7 @@
 import AISettingsManager from './AISettingsManager.js';
 import AIQuestionClassifier from './AIQuestionClassifier.js';
 import AISmartDataRetriever from './AISmartDataRetriever.js';
+import AISemanticCache from './AISemanticCache.js';
 
 /**
  * AI Question Answerer
@@ -17,6 +18,7 @@ class AIQuestionAnswerer {
         // Initialize new AI components
         this.questionClassifier = new AIQuestionClassifier(this.aiSettingsManager);
         this.smartDataRetriever = new AISmartDataRetriever();
+        this.semanticCache = AISemanticCache.getShared();
         
         // Load AI settings if userId is provided
         if (userId) {
@@ -108,8 +110,9 @@ class AIQuestionAnswerer {
             // Legacy pattern: third param is shouldStop function
             shouldStop = answerContextOrShouldStop;
         } else if (answerContextOrShouldStop && typeof answerContextOrShouldStop === 'object') {
-            // New pattern: third param is answerContext object
+            // New pattern: third param is answerContext object (which may carry shouldStop)
             answerContext = answerContextOrShouldStop;
+            shouldStop = answerContext.shouldStop || null;
         } else if (answerContextOrShouldStop !== null) {
             // Could be a boolean or other value for shouldStop
             shouldStop = answerContextOrShouldStop;
@@ -120,6 +123,21 @@ class AIQuestionAnswerer {
             
             console.log(`AIQuestionAnswerer: Processing question: ${question}`);
             
+            // Step 0: Questions that map onto a single resume field need no model call at all,
+            // not even classification
+            const structuredAnswer = this.getStructuredAnswer(question, options);
+            if (structuredAnswer) {
+                console.log('AIQuestionAnswerer: Found structured answer:', structuredAnswer);
+                return { success: true, answer: structuredAnswer };
+            }
+            
+            // Step 0b: Reuse the answer to a semantically equivalent question for the same resume,
+            // before classification so a hit costs one embedding call and no generation
+            const cached = await this.lookupCachedAnswer(question, options, answerContext, resumeId);
+            if (cached.answer) {
+                return { success: true, answer: cached.answer };
+            }
+            
             // Step 1: Use AI to classify the question and extract keywords
             let classification = null;
             let relevantData = null;
@@ -143,7 +161,7 @@ class AIQuestionAnswerer {
             }
             
             // Step 3: Check for direct answers from relevant data
-            const directAnswer = this.getDirectAnswer(question, relevantData);
+            const directAnswer = this.getDirectAnswer(question, relevantData, options);
             if (directAnswer) {
                 console.log('AIQuestionAnswerer: Found direct answer:', directAnswer);
                 // If we have options, try to match the direct answer to one of them
@@ -194,8 +212,14 @@ class AIQuestionAnswerer {
             //console.log("Token Analysis:", tokenAnalysis);
             
             // Step 7: Get AI response using AISettingsManager
+            // The unchanging instructions go in the system prompt so every question
+            // shares the same prefix and Ollama can reuse its cached prefill
+            const generationOptions = this.getGenerationOptions(question, answerContext);
             const response = await this.aiSettingsManager.callAIWithStop({
+                system: this.buildSystemPrompt(),
                 prompt: prompt,
+                options: generationOptions,
+                max_tokens: generationOptions.num_predict,
                 stream: false
             }, shouldStop);
             
@@ -228,6 +252,11 @@ class AIQuestionAnswerer {
                 }
             }
 
+            // Held back until the caller confirms the form accepted the answer
+            if (answer && cached.entry) {
+                this.semanticCache.stage(question, { ...cached.entry, answer });
+            }
+
             // If we have options, ensure answer matches one of them
             if (options && Array.isArray(options) && options.length > 0) {
                 answer = this.matchToOption(answer, options);
@@ -257,6 +286,288 @@ class AIQuestionAnswerer {
         }
     }
 
+    /**
+     * Get Ollama generation options sized to the expected answer length
+     * @param {string} question - The question (optional)
+     * @param {Object} answerContext - Optional answer format context
+     * @returns {Object} - Ollama options (num_predict, temperature, top_k, stop)
+     */
+    getGenerationOptions(question = '', answerContext = null) {
+        // Form answers are a word or a sentence; only free-text fields like
+        // cover letters need room for a longer answer
+        return {
+            num_predict: this.isLongFormQuestion(question, answerContext) ? 1024 : 128,
+            temperature: 0.2,
+            top_k: 20,
+            stop: ["\n\nQUESTION:", "\n\n---"]
+        };
+    }
+
+    /**
+     * Check if a question expects a free-text answer longer than a sentence
+     * @param {string} question - The question
+     * @param {Object} answerContext - Optional answer format context
+     * @returns {boolean} - True for cover letters and similar free-text fields
+     */
+    isLongFormQuestion(question, answerContext = null) {
+        const questionLower = (question || '').toLowerCase();
+        return answerContext?.inputElement?.tagName === 'TEXTAREA' ||
+            ['cover letter', 'anschreiben', 'motivation', 'describe', 'beschreiben'].some(term => questionLower.includes(term));
+    }
+
+    /**
+     * Check whether an answer may be reused for similar questions later; runs before
+     * classification, so it only uses keyword checks
+     * @param {string} question - The question
+     * @param {Object} answerContext - Optional answer format context
+     * @returns {boolean} - True if the semantic cache should be used
+     */
+    isSemanticCacheable(question, answerContext = null) {
+        // Embeddings come from the local Ollama server
+        if (this.aiSettingsManager.getProvider() !== 'ollama') {
+            return false;
+        }
+        // Date-relative answers (start dates, notice periods) go stale
+        if (this.isNoticePeriodOrStartDateQuestion(question) || answerContext?.answerFormat?.type === 'date') {
+            return false;
+        }
+        // Experience and skill/language level questions differ only by the skill they name
+        // ("years with Python" vs "years with Java") and embed too closely to tell apart
+        const { question_type } = this.questionClassifier.getFallbackClassification(question);
+        if (['years_experience', 'language_proficiency'].includes(question_type)) {
+            return false;
+        }
+        if (/\b(level|proficien\w*|rate|niveau|kenntnisse)\b/i.test(question)) {
+            return false;
+        }
+        return !!(this.formatted_text);
+    }
+
+    /**
+     * Look up a cached answer for a question
+     * @param {string} question - The question
+     * @param {Array} options - Optional list of choices
+     * @param {Object} answerContext - Optional answer format context
+     * @param {string} resumeId - Optional resume ID, used when no resume text is loaded
+     * @returns {Promise<{answer: string|null, entry: Object|null}>} - Cached answer (matched to the options) and, on a miss, the cache entry to stage once the question is answered
+     */
+    async lookupCachedAnswer(question, options = null, answerContext = null, resumeId = null) {
+        if (!this.isSemanticCacheable(question, answerContext)) {
+            return { answer: null, entry: null };
+        }
+        try {
+            const resumeHash = await this.semanticCache.hashResume(this.formatted_text || resumeId);
+            const result = await this.semanticCache.lookup(this.semanticCache.buildCacheText(question, options), resumeHash);
+            if (result?.answer) {
+                const answer = options && Array.isArray(options) && options.length > 0
+                    ? this.matchToOption(result.answer, options)
+                    : result.answer;
+                return { answer, entry: null };
+            }
+            return { answer: null, entry: result ? { embedding: result.embedding, entities: result.entities, resumeHash } : null };
+        } catch (error) {
+            console.error('AIQuestionAnswerer: Semantic cache lookup failed:', error);
+            return { answer: null, entry: null };
+        }
+    }
+
+    /**
+     * Add an answer to the semantic cache once the form has accepted it; answers are staged
+     * on the shared cache, so any answerer instance can confirm them
+     * @param {string} question - The question as passed to answerQuestion() or answerQuestions()
+     */
+    async confirmAnswer(question) {
+        try {
+            await this.semanticCache.confirm(question);
+        } catch (error) {
+            console.error('AIQuestionAnswerer: Could not cache answer:', error);
+        }
+    }
+
+    /**
+     * Check whether a question can share a batch prompt
+     * @param {string} question - The question text
+     * @param {Object} answerContext - Optional answer format context
+     * @returns {boolean} - False for questions that need answerQuestion()'s own handling
+     */
+    isBatchable(question, answerContext = null) {
+        // Long-form answers would blow the batch's token budget
+        if (this.isLongFormQuestion(question, answerContext)) {
+            return false;
+        }
+        // The batch prompt has no room for per-field format rules
+        if (answerContext?.answerFormat) {
+            return false;
+        }
+        // Years of experience get their own prompt rules and the 5-year minimum
+        return this.questionClassifier.getFallbackClassification(question).question_type !== 'years_experience';
+    }
+
+    /**
+     * Answer several questions with a single AI call so the resume is only sent once
+     * @param {Array<{question: string, options: Array, inputElement: Element, answerFormat: Object}>} questions - Questions to answer; inputElement and answerFormat are optional
+     * @param {Function} shouldStop - Optional function to check if should stop
+     * @param {string} resumeId - Optional resume ID for structured data
+     * @returns {Promise<Array<string|null>>} - Answers in question order, null where no answer was produced
+     */
+    async answerQuestions(questions, shouldStop = null, resumeId = null) {
+        const answers = questions.map(() => null);
+
+        try {
+            await this.ensureSettingsLoaded();
+
+            // Direct answers don't need the AI at all; anything that needs answerQuestion()'s
+            // per-question prompt rules or post-processing is answered individually below
+            const candidates = [];
+            questions.forEach(({ question, options, inputElement, answerFormat }, index) => {
+                const directAnswer = this.getDirectAnswer(question, null, options);
+                if (directAnswer) {
+                    answers[index] = options && options.length > 0 ? this.matchToOption(directAnswer, options) : directAnswer;
+                } else if (this.isBatchable(question, { inputElement, answerFormat })) {
+                    candidates.push(index);
+                }
+            });
+
+            // Answers to questions already seen on earlier applications come from the cache
+            const cacheEntries = new Map();
+            const pending = [];
+            const lookups = await Promise.all(candidates.map(index => {
+                const { question, options, inputElement } = questions[index];
+                return this.lookupCachedAnswer(question, options, { inputElement }, resumeId);
+            }));
+            lookups.forEach((cached, i) => {
+                const index = candidates[i];
+                if (cached.answer) {
+                    answers[index] = cached.answer;
+                    return;
+                }
+                if (cached.entry) {
+                    cacheEntries.set(index, cached.entry);
+                }
+                pending.push(index);
+            });
+
+            if (pending.length > 0) {
+                const prompt = this.buildBatchPrompt(pending.map(index => questions[index]));
+                console.log(`AIQuestionAnswerer: Answering ${pending.length} questions in one batch`);
+
+                const maxTokens = this.getGenerationOptions().num_predict * pending.length;
+                const response = await this.aiSettingsManager.callAIWithStop({
+                    prompt: prompt,
+                    format: 'json',
+                    options: { num_predict: maxTokens, temperature: 0.2 },
+                    max_tokens: maxTokens,
+                    stream: false
+                }, shouldStop);
+
+                if (response && response.stopped) {
+                    return answers;
+                }
+
+                const batchAnswers = this.parseBatchResponse(response, pending.length);
+                pending.forEach((questionIndex, batchIndex) => {
+                    const answer = batchAnswers[batchIndex];
+                    if (typeof answer !== 'string' || !answer.trim()) {
+                        return;
+                    }
+                    const { question, options } = questions[questionIndex];
+                    if (cacheEntries.has(questionIndex)) {
+                        this.semanticCache.stage(question, { ...cacheEntries.get(questionIndex), answer: answer.trim() });
+                    }
+                    answers[questionIndex] = options && options.length > 0 ? this.matchToOption(answer.trim(), options) : answer.trim();
+                });
+            }
+        } catch (error) {
+            console.error('AIQuestionAnswerer: Error in answerQuestions:', error);
+        }
+
+        // Questions the batch couldn't answer are independent, so ask for them
+        // concurrently; Ollama queues anything beyond OLLAMA_NUM_PARALLEL
+        const unanswered = answers
+            .map((answer, index) => answer ? null : index)
+            .filter(index => index !== null);
+        if (unanswered.length > 0) {
+            const results = await Promise.all(unanswered.map(index => {
+                const { question, options, inputElement, answerFormat } = questions[index];
+                return this.answerQuestion(question, options, { inputElement, answerFormat, shouldStop }, resumeId);
+            }));
+            results.forEach((result, i) => {
+                if (result.success && result.answer) {
+                    answers[unanswered[i]] = result.answer;
+                }
+            });
+        }
+
+        return answers;
+    }
+
+    /**
+     * Build a single prompt asking for answers to all given questions
+     * @param {Array<{question: string, options: Array, inputElement: Element}>} questions - Questions to answer; inputElement is optional
+     * @returns {string} - Formatted batch prompt
+     */
+    buildBatchPrompt(questions) {
+        const questionList = questions.map(({ question, options }, index) => {
+            let entry = `${index + 1}. ${question}`;
+            if (options && options.length > 0) {
+                entry += `\n   Available Options: ${JSON.stringify(options)}`;
+            }
+            return entry;
+        }).join('\n');
+
+        return `You are a job applicant filling out a job application form. Answer questions based on your resume information in first person (as "I" not "he/she").
+
+MY RESUME:
+${this.formatUserDataAsText()}
+
+QUESTIONS:
+${questionList}
+
+IMPORTANT GENERAL RULES:
+- Answer as the job applicant (use "I", "my", "me" - NOT "he", "she", "Sami", or third person)
+- Be concise and direct
+- Only provide the specific information requested
+- If a question has Available Options, answer with EXACTLY ONE option text as written
+
+Return a JSON object of the form {"answers": [...]} where "answers" is a JSON array of exactly ${questions.length} strings, one per question, in order.`;
+    }
+
+    /**
+     * Extract the answers array from a batch AI response
+     * @param {Object} response - AI response
+     * @param {number} expectedCount - Number of answers expected
+     * @returns {Array} - Parsed answers, one per question
+     */
+    parseBatchResponse(response, expectedCount) {
+        let responseText = "";
+        if (response?.response) {
+            // Ollama format
+            responseText = response.response.trim();
+        } else if (response?.choices?.[0]?.message?.content) {
+            // OpenAI format
+            responseText = response.choices[0].message.content.trim();
+        } else {
+            throw new Error('Unexpected AI response format');
+        }
+
+        const jsonMatch = responseText.match(/[\[{][\s\S]*[\]}]/);
+        if (!jsonMatch) {
+            throw new Error('No JSON found in batch response');
+        }
+
+        const parsed = JSON.parse(jsonMatch[0]);
+        const batchAnswers = Array.isArray(parsed) ? parsed : (parsed.answers || Object.values(parsed).find(Array.isArray));
+        if (!Array.isArray(batchAnswers)) {
+            throw new Error('No answers array in batch response');
+        }
+
+        // A short or long array can't be aligned with the questions reliably
+        if (batchAnswers.length !== expectedCount) {
+            throw new Error(`Expected ${expectedCount} batch answers, got ${batchAnswers.length}`);
+        }
+        return batchAnswers.map(answer => (answer === null || answer === undefined) ? null : String(answer));
+    }
+
     /**
      * Detect question type for optimized data retrieval
      * @param {string} question - The question to analyze
@@ -293,9 +604,10 @@ class AIQuestionAnswerer {
      * Check for direct answers from user data (email, phone, name, etc.)
      * @param {string} question - The question to check
      * @param {Object} relevantData - Optional structured data from database
+     * @param {Array} options - Optional list of choices, used for structured field answers
      * @returns {string|null} - Direct answer if found, null otherwise
      */
-    getDirectAnswer(question, relevantData = null) {
+    getDirectAnswer(question, relevantData = null, options = null) {
         // Try structured data first if available
         if (relevantData) {
             const questionLower = question.toLowerCase();
@@ -340,7 +652,7 @@ class AIQuestionAnswerer {
         
         // Fallback to user context data
         if (!this.user_data?.personal_information) {
-            return null;
+            return this.getStructuredAnswer(question, options);
         }
         
         const info = this.user_data.personal_information;
@@ -387,9 +699,110 @@ class AIQuestionAnswerer {
             }
         }
         
-        return null;
+        // Questions that map onto a single resume field
+        return this.getStructuredAnswer(question, options);
     }
     
+    /**
+     * Answer questions that map directly onto structured resume fields
+     * (current position, programming languages, highest degree)
+     * @param {string} question - The question to check
+     * @param {Array} options - Optional list of choices; the field value must match one of them
+     * @returns {string|null} - Answer built from user data, null if not applicable
+     */
+    getStructuredAnswer(question, options = null) {
+        if (!this.user_data || typeof this.user_data !== 'object') {
+            return null;
+        }
+        
+        const q = question.toLowerCase().trim();
+        const hasOptions = Array.isArray(options) && options.length > 0;
+        
+        // Years of experience, notice period, salary and motivation questions mention
+        // these fields but need reasoning (or their own handling), not a field lookup
+        if (/\b(years?|jahre[n]?|notice|kündigung|salary|gehalt|compensation|pay|why|warum|leave|reason|grund)\b/.test(q)) {
+            return null;
+        }
+        
+        let value = null;
+        
+        // Current job title / company (experiences are listed most recent first); only
+        // questions that ask for the field itself, e.g. "What is your current job title?"
+        // or a bare "Current company" label
+        const currentJob = Array.isArray(this.user_data.experiences) ? this.user_data.experiences[0] : null;
+        const asksCurrentJob =
+            /\b(what|which|who) is your (current|present) (job title|title|position|role|employer|company)\b/.test(q) ||
+            /^(current|present) (job title|title|position|employer|company)( name)?\s*[?:*]?$/.test(q) ||
+            /\b(was ist|wie lautet) (ihre|deine|ihr|dein) (aktuelle|derzeitige)[rn]? (position|berufsbezeichnung|stelle|arbeitgeber|firma)\b/.test(q);
+        const asksProgrammingLanguages =
+            /^(what|which|welche) (programming languages|programmiersprachen)\b/.test(q) ||
+            /^(programming languages|programmiersprachen)\s*[?:*]?$/.test(q);
+        const asksHighestEducation =
+            /^(what is your |was ist ihr )?(highest (level of )?(education|degree)|höchste[rn]? (bildungsabschluss|abschluss))\s*[?:*]?$/.test(q);
+        
+        if (currentJob && asksCurrentJob) {
+            const asksTitle = /\b(job title|title|position|role|berufsbezeichnung|stelle)\b/.test(q);
+            const asksCompany = /\b(company|employer|arbeitgeber|unternehmen|firma)\b/.test(q);
+            if (asksTitle && asksCompany && currentJob.position && currentJob.company) {
+                value = `${currentJob.position} at ${currentJob.company}`;
+            } else if (asksTitle && currentJob.position) {
+                value = currentJob.position;
+            } else if (asksCompany && currentJob.company) {
+                value = currentJob.company;
+            }
+        } else if (asksProgrammingLanguages && !hasOptions && Array.isArray(this.user_data.skills)) {
+            // A list of languages can't pick a single choice, so only free-text fields
+            const languages = this.user_data.skills
+                .filter(skill => skill?.name && /programming languages?/i.test(skill.category || ''))
+                .map(skill => skill.name);
+            if (languages.length > 0) {
+                value = languages.join(', ');
+            }
+        } else if (asksHighestEducation && Array.isArray(this.user_data.education) && this.user_data.education[0]?.degree) {
+            // Education is listed highest degree first
+            value = this.user_data.education[0].degree;
+        }
+        
+        if (!value || !hasOptions) {
+            return value;
+        }
+        // matchToOption() falls back to an arbitrary option, so only answer when the field
+        // value actually matches one; otherwise let the model choose
+        return this.findMatchingOption(value, options);
+    }
+
+    /**
+     * Find the option that equals or contains the answer (or is contained in it)
+     * @param {string} answer - Answer to match
+     * @param {Array} options - Available choices
+     * @returns {string|null} - Matching option, or null if none matches
+     */
+    findMatchingOption(answer, options) {
+        const answerLower = answer.toLowerCase();
+        const exact = options.find(option => option.toLowerCase() === answerLower);
+        if (exact) {
+            return exact;
+        }
+        return options.find(option => {
+            const optionLower = option.toLowerCase();
+            return optionLower.includes(answerLower) || answerLower.includes(optionLower);
+        }) || null;
+    }
+
+    /**
+     * Build the system prompt shared by every question
+     * @returns {string} - Static applicant instructions
+     */
+    buildSystemPrompt() {
+        return `You are a job applicant filling out a job application form. Answer questions based on your resume information in first person (as "I" not "he/she").
+
+IMPORTANT GENERAL RULES:
+- Answer as the job applicant (use "I", "my", "me" - NOT "he", "she", "Sami", or third person)
+- Be concise and direct
+- Only provide the specific information requested
+- Do not mention your name unless explicitly asked`;
+    }
+
     /**
      * Build smart prompt with minimal relevant data
      * @param {string} question - The question
@@ -409,18 +822,11 @@ class AIQuestionAnswerer {
             console.log("AIQuestionAnswerer: No relevant data - using fallback prompt");
         }
         
-        let prompt = `You are a job applicant filling out a job application form. Answer questions based on your resume information in first person (as "I" not "he/she").
-
-RELEVANT RESUME DATA:
+        // General instructions are sent separately, see buildSystemPrompt()
+        let prompt = `RELEVANT RESUME DATA:
 ${contextData}
 
-QUESTION: ${question}
-
-IMPORTANT GENERAL RULES:
-- Answer as the job applicant (use "I", "my", "me" - NOT "he", "she", "Sami", or third person)
-- Be concise and direct
-- Only provide the specific information requested
-- Do not mention your name unless explicitly asked`;
+QUESTION: ${question}`;
 
         // Add question type specific rules
         switch (classification.question_type) {
@@ -57,9 +57,9 @@ class AIQuestionClassifier {
      * @returns {string} Classification prompt
      */
     buildClassificationPrompt(question) {
-        return `You are an expert at analyzing job application questions. Classify the following question and extract relevant keywords.
-
-QUESTION: "${question}"
+        // The question goes last so the long static instructions form an identical
+        // prefix across calls, letting Ollama reuse its cached prefill
+        return `You are an expert at analyzing job application questions. Classify the question given at the end and extract relevant keywords.
 
 Analyze and return ONLY a JSON object with these fields:
 {
@@ -92,6 +92,8 @@ Q: "Wie gut beherrschen Sie Deutsch?" → {"question_type":"language_proficiency
 Q: "How many years of experience do you have with Python?" → {"question_type":"years_experience","keywords":["Python"],"confidence":0.9,"language":"en","expected_format":"number"}
 Q: "What is your proficiency level in SAP?" → {"question_type":"skill_level","keywords":["SAP"],"confidence":0.9,"language":"en","expected_format":"selection"}
 
+QUESTION: "${question}"
+
 Return ONLY the JSON object:`;
     }
 
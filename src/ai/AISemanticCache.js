@@ -0,0 +1,331 @@
+/**
+ * AI Semantic Cache
+ * Reuses answers for questions that are semantically equivalent to ones already answered
+ * for the same resume, using Ollama embeddings and cosine similarity
+ */
+class AISemanticCache {
+    constructor(options = {}) {
+        this.embeddingModel = options.embeddingModel || 'nomic-embed-text';
+        this.threshold = options.threshold || 0.92;
+        this.maxEntries = options.maxEntries || 200;
+        this.storageKey = 'aiSemanticCache';
+        // Bump when the stored entry format changes; caches in any other format are ignored
+        this.storageVersion = 1;
+        this.entries = []; // { embedding: { values: Int8Array, scale }, resumeHash, entities, answer }
+        this.loadPromise = null;
+        this.disabled = false;
+        // Answers waiting for the form to accept them, keyed by question; shared by every
+        // answerer in this context, so the one that filled a field can confirm its answer
+        this.pendingEntries = new Map();
+        this.maxPendingEntries = 50;
+    }
+
+    /**
+     * Get the cache shared by all AIQuestionAnswerer instances in this context
+     * @returns {AISemanticCache} - Shared cache instance
+     */
+    static getShared() {
+        if (!AISemanticCache.sharedInstance) {
+            AISemanticCache.sharedInstance = new AISemanticCache();
+        }
+        return AISemanticCache.sharedInstance;
+    }
+
+    /**
+     * Hash resume text so cached answers are only reused for the same resume
+     * @param {string} resumeText - Resume text or identifier
+     * @returns {Promise<string>} - SHA-256 hex digest
+     */
+    async hashResume(resumeText) {
+        const bytes = new TextEncoder().encode(resumeText || '');
+        const digest = await crypto.subtle.digest('SHA-256', bytes);
+        return Array.from(new Uint8Array(digest), b => b.toString(16).padStart(2, '0')).join('');
+    }
+
+    /**
+     * Build the text that gets embedded for a question
+     * @param {string} question - The question
+     * @param {Array} options - Optional list of choices
+     * @returns {string} - Text to embed
+     */
+    buildCacheText(question, options = null) {
+        if (options && Array.isArray(options) && options.length > 0) {
+            return `${question}\nOptions: ${options.join(', ')}`;
+        }
+        return question;
+    }
+
+    /**
+     * Collect the names a question mentions (skills, companies, languages) so questions that
+     * only differ by one of them never share an answer, however close their embeddings are
+     * @param {string} text - Cache text from buildCacheText()
+     * @returns {string} - Sorted, lowercased terms joined with '|'
+     */
+    extractEntities(text) {
+        const terms = new Set();
+        for (const sentence of text.split(/[?!:\n]+|\.\s+/)) {
+            // A sentence's first word is capitalized for grammar, not because it is a name
+            for (const word of sentence.trim().split(/\s+/).slice(1)) {
+                const term = word.replace(/^[^\w+#]+|[^\w+#]+$/g, '');
+                if (term !== 'I' && /[A-Z0-9+#]/.test(term)) {
+                    terms.add(term.toLowerCase());
+                }
+            }
+        }
+        return Array.from(terms).sort().join('|');
+    }
+
+    /**
+     * Get a unit-length embedding for text via Ollama
+     * @param {string} text - Text to embed
+     * @returns {Promise<Float32Array|null>} - Normalized embedding or null on failure
+     */
+    async embed(text) {
+        if (this.disabled) {
+            return null;
+        }
+
+        try {
+            const response = await chrome.runtime.sendMessage({
+                action: 'callOllama',
+                endpoint: 'embeddings',
+                data: {
+                    model: this.embeddingModel,
+                    prompt: text
+                }
+            });
+
+            if (!response || response.success === false) {
+                throw new Error(response?.error || 'Unknown error from Ollama embeddings');
+            }
+
+            return this.normalize(Float32Array.from(response.data.embedding));
+        } catch (error) {
+            // Most likely the embedding model isn't pulled; don't retry on every question
+            console.warn(`AISemanticCache: Embeddings unavailable (${this.embeddingModel}), disabling cache:`, error.message);
+            this.disabled = true;
+            return null;
+        }
+    }
+
+    /**
+     * Scale a vector to unit length so cosine similarity is a plain dot product
+     * @param {Float32Array} vector - Vector to normalize
+     * @returns {Float32Array} - The same vector, normalized in place
+     */
+    normalize(vector) {
+        let norm = 0;
+        for (let i = 0; i < vector.length; i++) {
+            norm += vector[i] * vector[i];
+        }
+        norm = Math.sqrt(norm);
+        if (norm > 0) {
+            for (let i = 0; i < vector.length; i++) {
+                vector[i] /= norm;
+            }
+        }
+        return vector;
+    }
+
+    /**
+     * Quantize a unit vector to int8 with a per-vector scale; cosine similarity
+     * survives the rounding and the cache takes a quarter of the memory
+     * @param {Float32Array} vector - Vector to quantize
+     * @returns {{values: Int8Array, scale: number}} - Quantized vector, where vector[i] ≈ values[i] * scale
+     */
+    quantize(vector) {
+        let maxAbs = 0;
+        for (let i = 0; i < vector.length; i++) {
+            maxAbs = Math.max(maxAbs, Math.abs(vector[i]));
+        }
+        const scale = maxAbs > 0 ? maxAbs / 127 : 1;
+        const values = new Int8Array(vector.length);
+        for (let i = 0; i < vector.length; i++) {
+            values[i] = Math.round(vector[i] / scale);
+        }
+        return { values, scale };
+    }
+
+    /**
+     * Find a cached answer for a semantically equivalent question
+     * @param {string} text - Cache text from buildCacheText()
+     * @param {string} resumeHash - Hash of the resume the answer must belong to
+     * @returns {Promise<{answer: string|null, embedding: Object, entities: string}|null>} - Cached answer (if any), the quantized query embedding and its entity terms, or null if embeddings are unavailable
+     */
+    async lookup(text, resumeHash) {
+        await this.load();
+        const vector = await this.embed(text);
+        if (!vector) {
+            return null;
+        }
+
+        const embedding = this.quantize(vector);
+        const entities = this.extractEntities(text);
+        const query = embedding.values;
+        let bestScore = -1;
+        let bestEntry = null;
+        for (const entry of this.entries) {
+            const values = entry.embedding.values;
+            if (entry.resumeHash !== resumeHash || entry.entities !== entities || values.length !== query.length) {
+                continue;
+            }
+            let dot = 0;
+            for (let i = 0; i < query.length; i++) {
+                dot += query[i] * values[i];
+            }
+            const score = dot * embedding.scale * entry.embedding.scale;
+            if (score > bestScore) {
+                bestScore = score;
+                bestEntry = entry;
+            }
+        }
+
+        if (bestEntry && bestScore >= this.threshold) {
+            console.log(`AISemanticCache: Cache hit (similarity ${bestScore.toFixed(3)})`);
+            return { answer: bestEntry.answer, embedding, entities };
+        }
+        return { answer: null, embedding, entities };
+    }
+
+    /**
+     * Store an answer for later reuse
+     * @param {Object} embedding - Quantized question embedding returned by lookup()
+     * @param {string} resumeHash - Hash of the resume the answer belongs to
+     * @param {string} answer - The answer to cache
+     * @param {string} entities - Entity terms returned by lookup()
+     */
+    async store(embedding, resumeHash, answer, entities = '') {
+        if (!embedding || !answer) {
+            return;
+        }
+
+        await this.load();
+        this.entries.push({ embedding, resumeHash, entities, answer });
+        if (this.entries.length > this.maxEntries) {
+            this.entries.splice(0, this.entries.length - this.maxEntries);
+        }
+        await this.save();
+    }
+
+    /**
+     * Hold an answer until the form has accepted it
+     * @param {string} question - The question, used as the key for confirm()
+     * @param {Object} entry - { embedding, entities, resumeHash, answer } from lookup() plus the answer
+     */
+    stage(question, entry) {
+        this.pendingEntries.delete(question);
+        this.pendingEntries.set(question, entry);
+        // Rejected answers are never confirmed; drop the oldest ones
+        while (this.pendingEntries.size > this.maxPendingEntries) {
+            this.pendingEntries.delete(this.pendingEntries.keys().next().value);
+        }
+    }
+
+    /**
+     * Store a staged answer once the form has accepted it
+     * @param {string} question - The question the answer was staged for
+     */
+    async confirm(question) {
+        const entry = this.pendingEntries.get(question);
+        if (!entry) {
+            return;
+        }
+        this.pendingEntries.delete(question);
+        await this.store(entry.embedding, entry.resumeHash, entry.answer, entry.entities);
+    }
+
+    /**
+     * Load persisted entries from Chrome storage (once per context)
+     * @returns {Promise<void>}
+     */
+    load() {
+        if (!this.loadPromise) {
+            this.loadPromise = (async () => {
+                try {
+                    const result = await chrome.storage.local.get([this.storageKey]);
+                    const stored = result?.[this.storageKey];
+                    if (stored && stored.version === this.storageVersion &&
+                        stored.embeddingModel === this.embeddingModel && Array.isArray(stored.entries)) {
+                        this.entries = stored.entries.map(entry => ({
+                            embedding: { values: this.decodeVector(entry.embedding), scale: entry.scale },
+                            resumeHash: entry.resumeHash,
+                            entities: entry.entities,
+                            answer: entry.answer
+                        }));
+                        console.log(`AISemanticCache: Loaded ${this.entries.length} cached answers`);
+                    }
+                } catch (error) {
+                    console.error('AISemanticCache: Error loading cache:', error);
+                }
+            })();
+        }
+        return this.loadPromise;
+    }
+
+    /**
+     * Persist entries to Chrome storage
+     * @returns {Promise<void>}
+     */
+    async save() {
+        try {
+            await chrome.storage.local.set({
+                [this.storageKey]: {
+                    version: this.storageVersion,
+                    embeddingModel: this.embeddingModel,
+                    entries: this.entries.map(entry => ({
+                        embedding: this.encodeVector(entry.embedding.values),
+                        scale: entry.embedding.scale,
+                        resumeHash: entry.resumeHash,
+                        entities: entry.entities,
+                        answer: entry.answer
+                    }))
+                }
+            });
+        } catch (error) {
+            console.error('AISemanticCache: Error saving cache:', error);
+        }
+    }
+
+    /**
+     * Encode a vector's raw bytes as base64 for storage; chrome.storage serializes
+     * values as JSON, and a number array costs ~20 characters per float to write
+     * and parse back
+     * @param {Int8Array} vector - Vector to encode
+     * @returns {string} - Base64 string
+     */
+    encodeVector(vector) {
+        const bytes = new Uint8Array(vector.buffer, vector.byteOffset, vector.byteLength);
+        let binary = '';
+        for (let i = 0; i < bytes.length; i += 0x8000) {
+            binary += String.fromCharCode.apply(null, bytes.subarray(i, i + 0x8000));
+        }
+        return btoa(binary);
+    }
+
+    /**
+     * Decode a base64 vector written by encodeVector()
+     * @param {string} encoded - Base64 string
+     * @returns {Int8Array} - Decoded vector
+     */
+    decodeVector(encoded) {
+        const binary = atob(encoded);
+        const bytes = new Uint8Array(binary.length);
+        for (let i = 0; i < binary.length; i++) {
+            bytes[i] = binary.charCodeAt(i);
+        }
+        return new Int8Array(bytes.buffer);
+    }
+
+    /**
+     * Clear all cached answers
+     */
+    async clear() {
+        this.entries = [];
+        await this.save();
+        console.log('AISemanticCache: Cache cleared');
+    }
+}
+
+AISemanticCache.sharedInstance = null;
+
+export default AISemanticCache;
@@ -158,7 +158,8 @@ class AISettingsManager {
             
             if (provider === 'ollama') {
                 const response = await chrome.runtime.sendMessage({
-                    action: 'testOllama'
+                    action: 'testOllama',
+                    model: this.getModel()
                 });
                 return response;
             } else if (provider === 'openai') {
@@ -6,6 +6,31 @@ class AIManager {
     constructor(backgroundManager) {
         this.backgroundManager = backgroundManager;
         this.OLLAMA_BASE_URL = 'http://localhost:11434';
+        this.DEFAULT_OLLAMA_MODEL = 'qwen2.5:3b';
+        // Abort a streamed response if Ollama goes silent for this long (covers model load)
+        this.OLLAMA_CHUNK_TIMEOUT_MS = 120000;
+        // Default headers that ollamaFetch() sends with every Ollama request
+        this.ollamaHeaders = {
+            'Content-Type': 'application/json',
+            'Accept': 'application/json'
+        };
+        // Successful Ollama connection tests by model, so repeated checks don't
+        // each run a chat completion
+        this.ollamaConnectionResults = {};
+    }
+
+    /**
+     * Send a request to the local Ollama server
+     * @param {string} path - API path, e.g. '/api/generate'
+     * @param {Object} options - fetch options (method, body, signal)
+     * @returns {Promise<Response>} - fetch response
+     */
+    ollamaFetch(path, options = {}) {
+        return fetch(`${this.OLLAMA_BASE_URL}${path}`, {
+            ...options,
+            method: options.method || 'GET',
+            headers: { ...this.ollamaHeaders, ...options.headers }
+        });
     }
 
     /**
@@ -43,21 +68,20 @@ class AIManager {
         try {
             const { method, url, data } = request;
             
-            const ollamaUrl = `${this.OLLAMA_BASE_URL}${url}`;
             const options = {
-                method: method || 'GET',
-                headers: {
-                    'Content-Type': 'application/json',
-                }
+                method: method || 'GET'
             };
 
             if (data && (method === 'POST' || method === 'PUT')) {
                 options.body = JSON.stringify(data);
             }
 
-            const response = await fetch(ollamaUrl, options);
+            const response = await this.ollamaFetch(url, options);
             
             if (!response.ok) {
+                if (data?.model) {
+                    this.invalidateOllamaConnection(data.model);
+                }
                 sendResponse({ 
                     success: false, 
                     error: `Ollama request failed: ${response.status} ${response.statusText}` 
@@ -69,6 +93,7 @@ class AIManager {
             sendResponse({ success: true, ...result });
         } catch (error) {
             console.error('Ollama request error:', error);
+            this.invalidateOllamaConnection(request.data?.model);
             sendResponse({ 
                 success: false, 
                 error: 'Error connecting to Ollama. Make sure it\'s running on localhost:11434.' 
@@ -96,7 +121,7 @@ class AIManager {
      */
     async handleTestOllama(request, sendResponse) {
         try {
-            const result = await this.testOllamaConnection();
+            const result = await this.testOllamaConnection(request.model, !!request.force);
             sendResponse(result);
         } catch (error) {
             sendResponse({ success: false, error: error.message });
@@ -115,7 +140,7 @@ class AIManager {
         }
         
         if (aiSettings.provider === 'ollama') {
-            const result = await this.testOllamaConnection();
+            const result = await this.testOllamaConnection(aiSettings.model);
             if (!result.success) {
                 throw new Error(`Ollama connection failed: ${result.error}`);
             }
@@ -136,13 +161,21 @@ class AIManager {
     }
 
     /**
-     * Test Ollama connection
+     * Test Ollama connection; a successful result is reused until a call using the model fails
+     * @param {string} model - Model to test with (defaults to DEFAULT_OLLAMA_MODEL)
+     * @param {boolean} force - Run the test even if a successful result is cached
      */
-    async testOllamaConnection() {
+    async testOllamaConnection(model = null, force = false) {
+        const testModel = model || this.DEFAULT_OLLAMA_MODEL;
+        if (!force && this.ollamaConnectionResults[testModel]) {
+            console.log('Using cached Ollama connection result for', testModel);
+            return this.ollamaConnectionResults[testModel];
+        }
+        
         try {
             console.log('Testing Ollama connection...');
             const testMessage = {
-                model: "qwen2.5:3b",
+                model: testModel,
                 messages: [
                     {
                         role: "system",
@@ -162,7 +195,7 @@ class AIManager {
             if (result.success) {
                 console.log('Ollama chat test successful:', result.data);
                 
-                return { 
+                const connectionResult = { 
                     success: true, 
                     data: {
                         provider: 'ollama',
@@ -171,6 +204,8 @@ class AIManager {
                         port: 11434
                     }
                 };
+                this.ollamaConnectionResults[testModel] = connectionResult;
+                return connectionResult;
             } else {
                 // If callOllamaAPI returned an error
                 throw new Error(result.error || 'Unknown error from Ollama');
@@ -186,25 +221,71 @@ class AIManager {
         }
     }
 
+    /**
+     * Forget cached connection test results after a failed Ollama call
+     * @param {string} model - Model the failed call used; omit to forget every model
+     */
+    invalidateOllamaConnection(model = null) {
+        if (model) {
+            delete this.ollamaConnectionResults[model];
+        } else {
+            this.ollamaConnectionResults = {};
+        }
+    }
+
+    /**
+     * Load an Ollama model with an empty prompt, so a later request doesn't wait for it
+     * @param {string} model - Model name
+     * @param {number|string} keepAlive - Optional Ollama keep_alive for this request (0 unloads
+     *   the model); Ollama applies keep_alive per request, so it doesn't carry over to later calls
+     * @returns {Promise<Object>} - Success status
+     */
+    async loadOllamaModel(model, keepAlive = null) {
+        try {
+            const requestData = { model, prompt: '', stream: false };
+            if (keepAlive !== null) {
+                requestData.keep_alive = keepAlive;
+            }
+            const response = await this.ollamaFetch('/api/generate', {
+                method: 'POST',
+                body: JSON.stringify(requestData)
+            });
+
+            if (!response.ok) {
+                throw new Error(`HTTP error! status: ${response.status}, details: ${await response.text()}`);
+            }
+
+            console.log(keepAlive === 0 ? `Ollama model ${model} unloaded` : `Ollama model ${model} loaded`);
+            return { success: true };
+        } catch (error) {
+            console.warn(`Could not load Ollama model ${model}:`, error);
+            this.invalidateOllamaConnection(error.message.includes('Failed to fetch') ? null : model);
+            return { success: false, error: error.message };
+        }
+    }
+
     /**
      * Make Ollama API calls (for complex AI operations)
      */
     async callOllamaAPI(endpoint, data) {
         try {
-            const port = 11434;
+            // Text generation is streamed so a stalled model can be detected per chunk;
+            // other endpoints return a single JSON object
+            const streamed = endpoint === 'generate' || endpoint === 'chat';
+            const requestData = { ...data, stream: streamed };
+            const controller = new AbortController();
+            const connectTimer = setTimeout(() => controller.abort(), this.OLLAMA_CHUNK_TIMEOUT_MS);
             
-            // Ensure stream is false for consistent behavior
-            const requestData = { ...data, stream: false };
-            
-            const response = await fetch(`http://localhost:${port}/api/${endpoint}`, {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                    'Accept': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                },
-                body: JSON.stringify(requestData),
-            });
+            let response;
+            try {
+                response = await this.ollamaFetch(`/api/${endpoint}`, {
+                    method: 'POST',
+                    body: JSON.stringify(requestData),
+                    signal: controller.signal
+                });
+            } finally {
+                clearTimeout(connectTimer);
+            }
 
             if (!response.ok) {
                 const errorText = await response.text();
@@ -216,36 +297,38 @@ class AIManager {
                 throw new Error(`HTTP error! status: ${response.status}, details: ${errorText}`);
             }
 
-            // Get the response text first to sanitize if needed
-            const responseText = await response.text();
-            
-            // Try to parse the response as JSON, with sanitization if needed
             let result;
-            try {
-                // First attempt: direct JSON parse
-                result = JSON.parse(responseText);
-            } catch (parseError) {
-                console.warn("JSON parse error:", parseError.message);
-                console.log("Response text:", responseText.substring(0, 200) + "...");
+            if (streamed) {
+                result = await this.readOllamaStream(response, endpoint, controller);
+            } else {
+                // Get the response text first to sanitize if needed
+                const responseText = await response.text();
                 
-                // Second attempt: Try to extract a valid JSON object
+                // Try to parse the response as JSON, with sanitization if needed
                 try {
-                    // Look for a pattern that might be a complete JSON object
-                    const jsonMatch = responseText.match(/\{[\s\S]*\}/);
-                    if (jsonMatch) {
-                        result = JSON.parse(jsonMatch[0]);
-                        console.log("Successfully extracted JSON from response");
-                    } else {
-                        throw new Error("Couldn't find valid JSON object in response");
+                    // First attempt: direct JSON parse
+                    result = JSON.parse(responseText);
+                } catch (parseError) {
+                    console.warn("JSON parse error:", parseError.message);
+                    console.log("Response text:", responseText.substring(0, 200) + "...");
+                    
+                    // Second attempt: Try to extract a valid JSON object
+                    try {
+                        // Look for a pattern that might be a complete JSON object
+                        const jsonMatch = responseText.match(/\{[\s\S]*\}/);
+                        if (jsonMatch) {
+                            result = JSON.parse(jsonMatch[0]);
+                            console.log("Successfully extracted JSON from response");
+                        } else {
+                            throw new Error("Couldn't find valid JSON object in response");
+                        }
+                    } catch (extractError) {
+                        console.error("Failed to extract JSON:", extractError);
+                        throw new Error(`Invalid JSON response from Ollama: ${parseError.message}`);
                     }
-                } catch (extractError) {
-                    console.error("Failed to extract JSON:", extractError);
-                    throw new Error(`Invalid JSON response from Ollama: ${parseError.message}`);
                 }
             }
             
-
-            
             // Validate response based on endpoint type
             if (endpoint === 'chat') {
                 // Chat endpoint should have a message with content
@@ -309,6 +392,10 @@ class AIManager {
         } catch (error) {
             console.error(`Ollama API call failed (${endpoint}):`, error);
             
+            // The next connection test has to run again: for every model if Ollama is unreachable,
+            // otherwise for the model this call used (e.g. it was removed and Ollama now returns 404)
+            this.invalidateOllamaConnection(error.message.includes('Failed to fetch') ? null : data?.model);
+            
             // Provide helpful troubleshooting info
             let troubleshooting = "Please make sure Ollama is running on your computer. Try running 'ollama serve' in your terminal.";
             
@@ -329,6 +416,74 @@ class AIManager {
         }
     }
 
+    /**
+     * Read a streamed (NDJSON) Ollama response and merge it into a single result
+     * @param {Response} response - fetch response with a streaming body
+     * @param {string} endpoint - 'generate' or 'chat'
+     * @param {AbortController} controller - Aborts the request when chunks stop arriving
+     * @returns {Promise<Object>} - Final chunk with the full generated text
+     */
+    async readOllamaStream(response, endpoint, controller) {
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        const parts = [];
+        let buffer = '';
+        let lastChunk = null;
+        let idleTimer = null;
+
+        const resetIdleTimer = () => {
+            clearTimeout(idleTimer);
+            idleTimer = setTimeout(() => controller.abort(), this.OLLAMA_CHUNK_TIMEOUT_MS);
+        };
+
+        const handleLine = (line) => {
+            if (!line.trim()) {
+                return;
+            }
+            const chunk = JSON.parse(line);
+            if (chunk.error) {
+                throw new Error(chunk.error);
+            }
+            parts.push(endpoint === 'chat' ? (chunk.message?.content || '') : (chunk.response || ''));
+            lastChunk = chunk;
+        };
+
+        try {
+            resetIdleTimer();
+            while (true) {
+                const { value, done } = await reader.read();
+                if (done) {
+                    break;
+                }
+                resetIdleTimer();
+
+                buffer += decoder.decode(value, { stream: true });
+                const lines = buffer.split('\n');
+                buffer = lines.pop();
+                lines.forEach(handleLine);
+            }
+            buffer += decoder.decode();
+            handleLine(buffer);
+        } catch (error) {
+            // Stop Ollama generating the rest of a response nobody will read
+            controller.abort();
+            reader.cancel().catch(() => {});
+            throw error;
+        } finally {
+            clearTimeout(idleTimer);
+        }
+
+        if (!lastChunk) {
+            return null;
+        }
+
+        const text = parts.join('');
+        if (endpoint === 'chat') {
+            return { ...lastChunk, message: { role: 'assistant', ...lastChunk.message, content: text } };
+        }
+        return { ...lastChunk, response: text };
+    }
+
     /**
      * Handle OpenAI API calls
      */
@@ -419,7 +574,7 @@ class AIManager {
      */
     async callOpenAIAPI(data) {
         try {
-            const { apiKey, model, prompt, messages, max_tokens = 1000, temperature = 0.7 } = data;
+            const { apiKey, model, prompt, system, messages, max_tokens = 1000, temperature = 0.7 } = data;
             
             if (!apiKey) {
                 throw new Error('OpenAI API key is required');
@@ -443,6 +598,12 @@ class AIManager {
                         content: prompt
                     }
                 ];
+                if (system) {
+                    requestBody.messages.unshift({
+                        role: "system",
+                        content: system
+                    });
+                }
             } else {
                 throw new Error('Either prompt or messages must be provided');
             }
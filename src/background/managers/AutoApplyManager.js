@@ -32,6 +32,7 @@ class AutoApplyManager {
      * Handle start auto apply
      */
     async handleStartAutoApply(request, sendResponse) {
+        let warmedUpModel = null;
         try {
             console.log('Starting auto apply with data:', request);
             
@@ -129,6 +130,14 @@ class AutoApplyManager {
                 isJobSearchPage: isJobPage 
             });
             
+            // Warm up the model so the first question doesn't wait for it to load (not awaited
+            // so starting isn't delayed). This doesn't pin it: Ollama's normal idle unloading
+            // applies again with every later request
+            if (request.aiSettings.provider === 'ollama') {
+                warmedUpModel = request.aiSettings.model;
+                aiManager.loadOllamaModel(warmedUpModel);
+            }
+            
             // Content script is already auto-injected via manifest.json
             // No need for manual injection - it would reset the isAutoApplyRunning variable
             console.log('Using auto-injected content script from manifest');
@@ -182,6 +191,11 @@ class AutoApplyManager {
         } catch (error) {
             console.error('Error starting auto apply:', error);
             this.backgroundManager.setAutoApplyState({ isRunning: false });
+            
+            // Auto-apply didn't start, so don't leave the warmed-up model occupying memory
+            if (warmedUpModel) {
+                this.backgroundManager.getManager('ai').loadOllamaModel(warmedUpModel, 0);
+            }
             sendResponse({ success: false, error: error.message });
         }
     }
@@ -746,24 +746,9 @@ class LinkedInForm extends LinkedInBase {
             const formElements = document.querySelectorAll("div.fb-dash-form-element");
             this.debugLog(`Found ${formElements.length} form elements`);
 
+            // Collect all answerable questions first so they can be sent to the AI in one batch
+            const questionEntries = [];
             for (const element of formElements) {
-                // Check if we should stop before processing each question
-                if (shouldStop) {
-                    let stopRequested = false;
-                    if (typeof shouldStop === 'function') {
-                        stopRequested = await shouldStop();
-                    } else if (shouldStop && shouldStop.value !== undefined) {
-                        stopRequested = shouldStop.value;
-                    } else {
-                        stopRequested = !!shouldStop;
-                    }
-                    
-                    if (stopRequested) {
-                        this.debugLog("Stop requested during form questions processing");
-                        return { stopped: true };
-                    }
-                }
-                
                 try {
                     const labelElement = element.querySelector("legend span.fb-dash-form-element__label span")
                         || element.querySelector("label");
@@ -774,7 +759,6 @@ class LinkedInForm extends LinkedInBase {
 
                     let questionText = labelElement.textContent.trim();
                     questionText = questionText.replace(/(.+?)\1/, '$1');
-                    this.debugLog(`Processing question: ${questionText}`);
 
                     // Check if this question should be skipped (already prefilled in LinkedIn)
                     if (this.shouldSkipQuestion(questionText)) {
@@ -806,12 +790,43 @@ class LinkedInForm extends LinkedInBase {
                             break;
                     }
 
+                    questionEntries.push({ questionText, options, inputField, element });
+                } catch (error) {
+                    this.errorLog(`Error processing form element: ${error.message}`, error);
+                }
+            }
+
+            const prefetchedAnswers = await this.prefetchAnswers(questionEntries, shouldStop);
+
+            for (const { questionText, options, inputField, element } of questionEntries) {
+                // Check if we should stop before processing each question
+                if (shouldStop) {
+                    let stopRequested = false;
+                    if (typeof shouldStop === 'function') {
+                        stopRequested = await shouldStop();
+                    } else if (shouldStop && shouldStop.value !== undefined) {
+                        stopRequested = shouldStop.value;
+                    } else {
+                        stopRequested = !!shouldStop;
+                    }
+                    
+                    if (stopRequested) {
+                        this.debugLog("Stop requested during form questions processing");
+                        return { stopped: true };
+                    }
+                }
+                
+                try {
+                    this.debugLog(`Processing question: ${questionText}`);
+
                     if (options.length > 0) {
                         this.debugLog(`Available options for "${questionText}":`);
                     }
 
                     // Pass the inputField directly to avoid redundant search
-                    const questionResult = await this.answerQuestion(questionText, options, inputField, element, shouldStop);
+                    const questionResult = await this.answerQuestion(
+                        questionText, options, inputField, element, shouldStop, prefetchedAnswers.get(questionText)
+                    );
                     
                     // Check if the process was stopped
                     if (questionResult.stopped) {
@@ -836,7 +851,54 @@ class LinkedInForm extends LinkedInBase {
         }
     }
 
-    static async answerQuestion(question, options = [], inputField, element, shouldStop = null) {
+    /**
+     * Answer all AI-bound questions of a form step up front, batched where possible
+     * @param {Array} questionEntries - Collected { questionText, options, inputField } entries
+     * @param {Function} shouldStop - Optional function to check if should stop
+     * @returns {Promise<Map<string, string>>} - Answers keyed by question text
+     */
+    static async prefetchAnswers(questionEntries, shouldStop = null) {
+        const prefetchedAnswers = new Map();
+        const aiQuestions = questionEntries
+            .filter(({ questionText, options }) => !this.getHardcodedAnswer(questionText, options))
+            .map(({ questionText, options, inputField }) => ({ question: questionText, options, inputElement: inputField }));
+
+        // A single question gains nothing from batching
+        if (aiQuestions.length < 2) {
+            return prefetchedAnswers;
+        }
+
+        try {
+            const userId = await this.getCurrentUserId();
+            const ai = new AIQuestionAnswerer(userId);
+
+            if (window.currentAiSettings) {
+                ai.aiSettingsManager.setSettings({
+                    ai_provider: window.currentAiSettings.provider,
+                    ai_model: window.currentAiSettings.model,
+                    apiKey: window.currentAiSettings.apiKey,
+                    is_default: true
+                });
+            }
+
+            await this.loadUserContextForAI(ai);
+
+            const { currentResumeId } = await chrome.storage.local.get(['currentResumeId']);
+            const answers = await ai.answerQuestions(aiQuestions, shouldStop, currentResumeId || null);
+            answers.forEach((answer, index) => {
+                if (answer) {
+                    prefetchedAnswers.set(aiQuestions[index].question, answer);
+                }
+            });
+            this.debugLog(`Prefetched ${prefetchedAnswers.size}/${aiQuestions.length} answers`);
+        } catch (error) {
+            this.errorLog('Error prefetching batched answers:', error);
+        }
+
+        return prefetchedAnswers;
+    }
+
+    static async answerQuestion(question, options = [], inputField, element, shouldStop = null, prefetchedAnswer = null) {
         try {
             // Check for hardcoded answers to common questions
             const hardcodedAnswer = this.getHardcodedAnswer(question, options);
@@ -993,8 +1055,10 @@ class LinkedInForm extends LinkedInBase {
                 this.errorLog('Error getting current resume ID:', error);
             }
 
-            // Get the answer using our simplified approach with stop callback
-            const result = await ai.answerQuestion(question, options, shouldStop, resumeId);
+            // Use the batched answer when available, otherwise ask the AI for this question alone
+            const result = prefetchedAnswer
+                ? { success: true, answer: prefetchedAnswer }
+                : await ai.answerQuestion(question, options, { inputElement: inputField, shouldStop }, resumeId);
 
             // Check if the process was stopped
             if (result.stopped) {
@@ -1110,6 +1174,11 @@ class LinkedInForm extends LinkedInBase {
                 return { stopped: true };
             }
             
+            // Only answers LinkedIn accepted as given may be reused for later applications
+            if (retryResult.success && !retryResult.retried) {
+                await ai.confirmAnswer(question);
+            }
+            
             return { success: retryResult.success };
         } catch (error) {
             this.errorLog(`Error answering question "${question}"`, error);
@@ -1309,7 +1378,7 @@ class LinkedInForm extends LinkedInBase {
                 
                 if (!validationResult.hasError) {
                     this.debugLog('No validation errors detected, field filled successfully');
-                    return { success: true };
+                    return { success: true, retried: retryCount > 0 };
                 }
                 
                 // Validation error detected, prepare for retry
@@ -1371,7 +1440,7 @@ class LinkedInForm extends LinkedInBase {
                 await this.loadUserContextForAI(ai);
                 
                 // Get retry answer
-                const retryResult = await ai.answerQuestion(retryPrompt, options, shouldStop, resumeId);
+                const retryResult = await ai.answerQuestion(retryPrompt, options, { inputElement: inputField, shouldStop }, resumeId);
                 
                 if (retryResult.stopped) {
                     return { stopped: true };
@@ -30,7 +30,8 @@ const AiManagerComponent = ({ currentUser, onAiSettingsUpdate }) => {
             name: 'Ollama (Local)',
             requiresApiKey: false,
             description: 'Local AI models running on your machine',
-            icon: Server
+            icon: Server,
+            defaultModel: 'qwen2.5:3b'
         },
         openai: {
             name: 'OpenAI',
@@ -76,7 +77,7 @@ const AiManagerComponent = ({ currentUser, onAiSettingsUpdate }) => {
     // Set default values when provider changes
     useEffect(() => {
         if (settingsForm.ai_provider === 'ollama') {
-            setSettingsForm(prev => ({ ...prev, ai_model: 'qwen2.5:3b' }));
+            setSettingsForm(prev => ({ ...prev, ai_model: AI_PROVIDERS.ollama.defaultModel }));
             // Only load Ollama models when user explicitly selects Ollama in the form
             // Don't auto-load on component initialization
         } else {
@@ -96,7 +97,7 @@ const AiManagerComponent = ({ currentUser, onAiSettingsUpdate }) => {
                 setAvailableModels(result.models);
                 
                 // Set qwen2.5:3b as default if available, otherwise use first model
-                const defaultModel = result.models.includes('qwen2.5:3b') ? 'qwen2.5:3b' : result.models[0];
+                const defaultModel = result.models.includes(AI_PROVIDERS.ollama.defaultModel) ? AI_PROVIDERS.ollama.defaultModel : result.models[0];
                 if (defaultModel) {
                     setSettingsForm(prev => ({ ...prev, ai_model: defaultModel }));
                 }
@@ -281,7 +282,9 @@ const AiManagerComponent = ({ currentUser, onAiSettingsUpdate }) => {
             let testResult;
             if (aiSettings.provider === 'ollama') {
                 testResult = await chrome.runtime.sendMessage({
-                    action: 'testOllama'
+                    action: 'testOllama',
+                    model: aiSettings.model,
+                    force: true
                 });
             } else if (aiSettings.provider === 'openai') {
                 testResult = await chrome.runtime.sendMessage({
@@ -17,6 +17,10 @@ class ResumeParser {
             'application/pdf',
             'text/plain'
         ];
+        this.cacheStorageKey = 'resumeParseCache';
+        this.maxCacheEntries = 3;
+        // Bump whenever the PDF extraction or result shape changes so stale cached results are ignored
+        this.parserVersion = 1;
     }
 
     /**
@@ -54,7 +58,7 @@ class ResumeParser {
             case '.json':
                 return await this._parseJson(fileObject);
             case '.pdf':
-                return await this._parsePdf(fileObject);
+                return await this._parsePdfCached(fileObject);
             case '.txt':
                 return await this._parseText(fileObject);
             default:
@@ -71,6 +75,89 @@ class ResumeParser {
         return filename.slice(filename.lastIndexOf('.'));
     }
 
+    /**
+     * Parse PDF resume, reusing a previous result for identical file content
+     * @param {File} file - PDF file object
+     * @returns {Promise<Object>} - Parsed data with formatted text and metadata
+     */
+    async _parsePdfCached(file) {
+        // Read the file once; the same buffer is hashed and handed to PDF.js
+        let arrayBuffer = null;
+        let hash = null;
+        try {
+            arrayBuffer = await this._readFileAsArrayBuffer(file);
+            hash = await this._hashBuffer(arrayBuffer);
+            const cached = await this._getCachedResult(hash);
+            if (cached) {
+                console.log('ResumeParser: Using cached PDF parse result');
+                return cached;
+            }
+        } catch (error) {
+            console.warn('ResumeParser: Parse cache unavailable:', error.message);
+        }
+
+        const result = await this._parsePdf(file, arrayBuffer);
+
+        if (hash) {
+            await this._setCachedResult(hash, result);
+        }
+        return result;
+    }
+
+    /**
+     * Compute a content hash for file contents
+     * @param {ArrayBuffer} arrayBuffer - File contents
+     * @returns {Promise<string>} - SHA-256 hex digest
+     */
+    async _hashBuffer(arrayBuffer) {
+        const digest = await crypto.subtle.digest('SHA-256', arrayBuffer);
+        return Array.from(new Uint8Array(digest), b => b.toString(16).padStart(2, '0')).join('');
+    }
+
+    /**
+     * Get the parse cache storage, if running inside the extension
+     * @returns {Object|null} - chrome.storage.local or null
+     */
+    _getCacheStorage() {
+        return (typeof chrome !== 'undefined' && chrome.storage && chrome.storage.local) || null;
+    }
+
+    /**
+     * Look up a cached parse result
+     * @param {string} hash - File content hash
+     * @returns {Promise<Object|null>} - Cached result or null
+     */
+    async _getCachedResult(hash) {
+        const storage = this._getCacheStorage();
+        if (!storage) {
+            return null;
+        }
+        const stored = await storage.get([this.cacheStorageKey]);
+        const entries = stored?.[this.cacheStorageKey] || [];
+        const entry = entries.find(e => e.hash === hash && e.version === this.parserVersion);
+        return entry ? entry.result : null;
+    }
+
+    /**
+     * Store a parse result, keeping only the most recent entries
+     * @param {string} hash - File content hash
+     * @param {Object} result - Parse result
+     */
+    async _setCachedResult(hash, result) {
+        const storage = this._getCacheStorage();
+        if (!storage) {
+            return;
+        }
+        try {
+            const stored = await storage.get([this.cacheStorageKey]);
+            const entries = (stored?.[this.cacheStorageKey] || []).filter(e => e.hash !== hash);
+            entries.unshift({ hash, version: this.parserVersion, result });
+            await storage.set({ [this.cacheStorageKey]: entries.slice(0, this.maxCacheEntries) });
+        } catch (error) {
+            console.warn('ResumeParser: Could not store parse result:', error.message);
+        }
+    }
+
     /**
      * Parse YAML resume
      * @param {File} file - YAML file object
@@ -136,9 +223,10 @@ class ResumeParser {
     /**
      * Parse PDF resume with enhanced debugging and link handling
      * @param {File} file - PDF file object
+     * @param {ArrayBuffer} arrayBuffer - Optional file contents, if already read
      * @returns {Promise<Object>} - Parsed data with structured and formatted text
      */
-    async _parsePdf(file) {
+    async _parsePdf(file, arrayBuffer = null) {
         try {
             console.log('ResumeParser: Starting PDF parsing...');
             console.log('ResumeParser: File name:', file.name);
@@ -151,105 +239,24 @@ class ResumeParser {
             }
             console.log('ResumeParser: PDF.js library found');
 
-            const arrayBuffer = await this._readFileAsArrayBuffer(file);
+            if (!arrayBuffer) {
+                arrayBuffer = await this._readFileAsArrayBuffer(file);
+            }
             console.log('ResumeParser: ArrayBuffer size:', arrayBuffer.byteLength);
             
             const pdf = await window.pdfjsLib.getDocument(arrayBuffer).promise;
             console.log('ResumeParser: PDF loaded, pages:', pdf.numPages);
             
-            let fullText = '';
-            let extractedLinks = [];
-            let pageDetails = [];
+            // Request every page up front so the PDF.js worker can decode them back to back
+            // instead of idling between round trips; Promise.all keeps page order
+            const pageNumbers = Array.from({ length: pdf.numPages }, (_, index) => index + 1);
+            const pages = await Promise.all(pageNumbers.map(i => this._extractPdfPage(pdf, i)));
             
-            for (let i = 1; i <= pdf.numPages; i++) {
-                console.log(`ResumeParser: Processing page ${i}/${pdf.numPages}`);
-                const page = await pdf.getPage(i);
-                console.log(`ResumeParser: Page ${i} size:`, page.getViewport({ scale: 1.0 }));
-                
-                // Get text content
-                const textContent = await page.getTextContent();
-                console.log(`ResumeParser: Page ${i} text items:`, textContent.items.length);
-                
-                // Extract text with position information
-                let pageText = '';
-                let pageLinks = [];
-                
-                for (let j = 0; j < textContent.items.length; j++) {
-                    const item = textContent.items[j];
-                    console.log(`ResumeParser: Page ${i} item ${j}:`, {
-                        str: item.str,
-                        dir: item.dir,
-                        transform: item.transform,
-                        width: item.width,
-                        height: item.height,
-                        fontName: item.fontName
-                    });
-                    
-                    pageText += item.str + ' ';
-                    
-                    // Check for potential links (URLs in text)
-                    const urlMatches = item.str.match(/(https?:\/\/[^\s]+)/gi);
-                    if (urlMatches) {
-                        pageLinks.push(...urlMatches);
-                        console.log(`ResumeParser: Found URLs in item ${j}:`, urlMatches);
-                    }
-                }
-                
-                // Try to get annotations (links, etc.)
-                try {
-                    const annotations = await page.getAnnotations();
-                    console.log(`ResumeParser: Page ${i} annotations:`, annotations.length);
-                    
-                    for (let k = 0; k < annotations.length; k++) {
-                        const annotation = annotations[k];
-                        console.log(`ResumeParser: Page ${i} annotation ${k}:`, {
-                            subtype: annotation.subtype,
-                            url: annotation.url,
-                            title: annotation.title,
-                            contents: annotation.contents
-                        });
-                        
-                        if (annotation.subtype === 'Link' && annotation.url) {
-                            pageLinks.push(annotation.url);
-                            console.log(`ResumeParser: Found link annotation:`, annotation.url);
-                        }
-                    }
-                } catch (annotationError) {
-                    console.log(`ResumeParser: Could not get annotations for page ${i}:`, annotationError.message);
-                }
-                
-                // Try to get operator list for more detailed content analysis
-                try {
-                    const opList = await page.getOperatorList();
-                    console.log(`ResumeParser: Page ${i} operator list length:`, opList.fnArray.length);
-                    
-                    // Look for text operators that might contain links
-                    for (let l = 0; l < opList.fnArray.length; l++) {
-                        const op = opList.fnArray[l];
-                        if (op === window.pdfjsLib.OPS.showText || op === window.pdfjsLib.OPS.showSpacedText) {
-                            const args = opList.argsArray[l];
-                            console.log(`ResumeParser: Page ${i} text operator ${l}:`, {
-                                operator: op,
-                                args: args
-                            });
-                        }
-                    }
-                } catch (opListError) {
-                    console.log(`ResumeParser: Could not get operator list for page ${i}:`, opListError.message);
-                }
-                
-                fullText += pageText + '\n';
-                extractedLinks.push(...pageLinks);
-                
-                pageDetails.push({
-                    pageNumber: i,
-                    textLength: pageText.length,
-                    linksFound: pageLinks.length,
-                    textItems: textContent.items.length
-                });
-            }
+            const pageTexts = pages.map(page => page.pageText);
+            const extractedLinks = pages.flatMap(page => page.pageLinks);
+            const pageDetails = pages.map(page => page.details);
             
-            const extractedText = fullText.trim();
+            const extractedText = pageTexts.join('\n').trim();
             console.log('ResumeParser: PDF parsing completed');
             console.log('ResumeParser: Total text length:', extractedText.length);
             console.log('ResumeParser: Total links found:', extractedLinks.length);
@@ -328,6 +335,70 @@ class ResumeParser {
         }
     }
 
+    /**
+     * Extract text and links from a single PDF page
+     * @param {Object} pdf - PDF.js document
+     * @param {number} i - 1-based page number
+     * @returns {Promise<Object>} - Page text, links and page details
+     */
+    async _extractPdfPage(pdf, i) {
+        console.log(`ResumeParser: Processing page ${i}/${pdf.numPages}`);
+        const page = await pdf.getPage(i);
+        console.log(`ResumeParser: Page ${i} size:`, page.getViewport({ scale: 1.0 }));
+        
+        // Get text content
+        const textContent = await page.getTextContent();
+        console.log(`ResumeParser: Page ${i} text items:`, textContent.items.length);
+        
+        // Extract text with position information
+        const pageText = textContent.items.map(item => item.str + ' ').join('');
+        let pageLinks = [];
+        
+        for (let j = 0; j < textContent.items.length; j++) {
+            const item = textContent.items[j];
+            // Check for potential links (URLs in text)
+            const urlMatches = item.str.match(/(https?:\/\/[^\s]+)/gi);
+            if (urlMatches) {
+                pageLinks.push(...urlMatches);
+                console.log(`ResumeParser: Found URLs in item ${j}:`, urlMatches);
+            }
+        }
+        
+        // Try to get annotations (links, etc.)
+        try {
+            const annotations = await page.getAnnotations();
+            console.log(`ResumeParser: Page ${i} annotations:`, annotations.length);
+            
+            for (let k = 0; k < annotations.length; k++) {
+                const annotation = annotations[k];
+                console.log(`ResumeParser: Page ${i} annotation ${k}:`, {
+                    subtype: annotation.subtype,
+                    url: annotation.url,
+                    title: annotation.title,
+                    contents: annotation.contents
+                });
+                
+                if (annotation.subtype === 'Link' && annotation.url) {
+                    pageLinks.push(annotation.url);
+                    console.log(`ResumeParser: Found link annotation:`, annotation.url);
+                }
+            }
+        } catch (annotationError) {
+            console.log(`ResumeParser: Could not get annotations for page ${i}:`, annotationError.message);
+        }
+        
+        return {
+            pageText,
+            pageLinks,
+            details: {
+                pageNumber: i,
+                textLength: pageText.length,
+                linksFound: pageLinks.length,
+                textItems: textContent.items.length
+            }
+        };
+    }
+
     /**
      * Parse plain text resume
      * @param {File} file - Text file object
@@ -348,49 +419,37 @@ class ResumeParser {
     }
 
     /**
-     * Read file as text using FileReader API
+     * Read file as text using the Blob API
      * @param {File} file - File object
      * @returns {Promise<string>} - File contents as text
      */
-    _readFileAsText(file) {
-        return new Promise((resolve, reject) => {
-            try {
-                if (!file || !(file instanceof Blob)) {
-                    reject(new Error('Invalid file object provided'));
-                    return;
-                }
-                
-                const reader = new FileReader();
-                reader.onload = (e) => resolve(e.target.result);
-                reader.onerror = (e) => reject(new Error('Failed to read file'));
-                reader.readAsText(file);
-            } catch (error) {
-                reject(new Error(`Error reading file as text: ${error.message}`));
-            }
-        });
+    async _readFileAsText(file) {
+        if (!file || !(file instanceof Blob)) {
+            throw new Error('Invalid file object provided');
+        }
+        
+        try {
+            return await file.text();
+        } catch (error) {
+            throw new Error(`Error reading file as text: ${error.message}`);
+        }
     }
 
     /**
-     * Read file as ArrayBuffer using FileReader API
+     * Read file as ArrayBuffer using the Blob API
      * @param {File} file - File object
      * @returns {Promise<ArrayBuffer>} - File contents as ArrayBuffer
      */
-    _readFileAsArrayBuffer(file) {
-        return new Promise((resolve, reject) => {
-            try {
-                if (!file || !(file instanceof Blob)) {
-                    reject(new Error('Invalid file object provided'));
-                    return;
-                }
-                
-                const reader = new FileReader();
-                reader.onload = (e) => resolve(e.target.result);
-                reader.onerror = (e) => reject(new Error('Failed to read file'));
-                reader.readAsArrayBuffer(file);
-            } catch (error) {
-                reject(new Error(`Error reading file as ArrayBuffer: ${error.message}`));
-            }
-        });
+    async _readFileAsArrayBuffer(file) {
+        if (!file || !(file instanceof Blob)) {
+            throw new Error('Invalid file object provided');
+        }
+        
+        try {
+            return await file.arrayBuffer();
+        } catch (error) {
+            throw new Error(`Error reading file as ArrayBuffer: ${error.message}`);
+        }
     }
 
     /**
@@ -399,52 +458,49 @@ class ResumeParser {
      * @returns {string} - Formatted text
      */
     _formatStructuredData(data) {
-        let formattedText = "";
+        const parts = [];
         
         if (typeof data === 'object' && data !== null && !Array.isArray(data)) {
             for (const [key, value] of Object.entries(data)) {
-                formattedText += `\n${key.toUpperCase().replace(/_/g, ' ')}:\n`;
-                formattedText += this._formatValue(value, 1);
+                parts.push(`\n${key.toUpperCase().replace(/_/g, ' ')}:\n`);
+                this._formatValue(value, 1, parts);
             }
         }
         
-        return formattedText.trim();
+        return parts.join('').trim();
     }
 
     /**
      * Recursively format values with proper indentation
      * @param {*} value - Value to format
      * @param {number} indent - Indentation level
-     * @returns {string} - Formatted value
+     * @param {Array<string>} parts - Output fragments, joined once by the caller
      */
-    _formatValue(value, indent = 0) {
+    _formatValue(value, indent, parts) {
         const indentStr = "  ".repeat(indent);
         
         if (typeof value === 'object' && value !== null) {
             if (Array.isArray(value)) {
-                let result = "";
                 for (const item of value) {
                     if (typeof item === 'object' && item !== null) {
-                        result += `${indentStr}- ${this._formatValue(item, indent + 1)}`;
+                        parts.push(`${indentStr}- `);
+                        this._formatValue(item, indent + 1, parts);
                     } else {
-                        result += `${indentStr}- ${item}\n`;
+                        parts.push(`${indentStr}- ${item}\n`);
                     }
                 }
-                return result;
             } else {
-                let result = "";
                 for (const [k, v] of Object.entries(value)) {
-                    result += `${indentStr}${k}: `;
                     if (typeof v === 'object' && v !== null) {
-                        result += `\n${this._formatValue(v, indent + 1)}`;
+                        parts.push(`${indentStr}${k}: \n`);
+                        this._formatValue(v, indent + 1, parts);
                     } else {
-                        result += `${v}\n`;
+                        parts.push(`${indentStr}${k}: ${v}\n`);
                     }
                 }
-                return result;
             }
         } else {
-            return `${indentStr}${value}\n`;
+            parts.push(`${indentStr}${value}\n`);
         }
     }
 }
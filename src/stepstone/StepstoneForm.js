@@ -2758,6 +2758,11 @@ class StepstoneForm {
                     is_skipped: false
                 });
                 
+                // The field accepted the answer, so it may be reused for later applications
+                if (fillResult.success) {
+                    await aiAnswerer.confirmAnswer(question);
+                }
+                
                 return { success: true };
             } else {
                 console.log(`❌ AI failed to generate answer for: ${question}`);